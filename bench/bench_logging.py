@@ -0,0 +1,124 @@
+"""
+Costo del logging en el hilo del request: handler síncrono (como antes) frente
+a la cola de main.configurar_logging, con y sin muestreo.
+
+Se mide el tiempo que tarda cada llamada a logger.info(...) en volver, que es
+lo que paga el request; la escritura a disco del QueueListener corre aparte.
+
+    sincrono:   StreamHandler a archivo con formato de texto, en el mismo hilo
+    cola:       ColaLog + FormatoJSON escrito por el QueueListener
+    muestreado: cola + FiltroMuestreo al 1% (líneas de cepreuna.upstream)
+
+Con --escritura-us se simula un destino lento (pipe a journald/docker bajo
+presión): cada escritura tarda ese tiempo sin soltar el lock del handler.
+
+Uso:
+    python bench/bench_logging.py [--lineas 20000] [--hilos 8] [--escritura-us 200]
+
+Para ver el efecto de extremo a extremo, comparar
+    LOG_NIVELES=cepreuna.upstream=INFO LOG_MUESTREO=cepreuna.upstream=1 python bench/load_test.py
+    python bench/load_test.py
+"""
+import argparse
+import logging
+import logging.handlers
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+import main  # noqa: E402
+
+
+class ArchivoLento:
+    """Archivo cuya escritura bloquea `retraso` segundos (time.sleep suelta el GIL)."""
+
+    def __init__(self, archivo, retraso: float):
+        self.archivo = archivo
+        self.retraso = retraso
+
+    def write(self, texto):
+        if self.retraso:
+            time.sleep(self.retraso)
+        return self.archivo.write(texto)
+
+    def flush(self):
+        self.archivo.flush()
+
+
+def _medir(registrador: logging.Logger, lineas: int, hilos: int) -> list:
+    duraciones = []
+    candado = threading.Lock()
+
+    def trabajar():
+        locales = []
+        for i in range(lineas // hilos):
+            inicio = time.perf_counter()
+            registrador.info("%s %s -> %s", "GET", f"https://app.cepreuna.edu.pe/estudiantes/get-horario?i={i}", 200)
+            locales.append((time.perf_counter() - inicio) * 1e6)
+        with candado:
+            duraciones.extend(locales)
+
+    trabajadores = [threading.Thread(target=trabajar) for _ in range(hilos)]
+    for t in trabajadores:
+        t.start()
+    for t in trabajadores:
+        t.join()
+    return duraciones
+
+
+def _registrador(nombre: str, handler: logging.Handler, filtro=None) -> logging.Logger:
+    registrador = logging.getLogger(f"bench.logging.{nombre}")
+    registrador.propagate = False
+    registrador.setLevel(logging.INFO)
+    registrador.handlers = [handler]
+    if filtro is not None:
+        registrador.addFilter(filtro)
+    return registrador
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))]
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lineas", type=int, default=20000)
+    parser.add_argument("--hilos", type=int, default=8, help="hilos logueando a la vez (como el threadpool)")
+    parser.add_argument("--escritura-us", type=float, default=0.0, help="latencia simulada de cada escritura")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="cepreuna-log-") as tmp:
+        retraso = args.escritura_us / 1e6
+        sincrono = logging.StreamHandler(ArchivoLento(open(Path(tmp) / "sincrono.log", "w"), retraso))
+        sincrono.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+
+        archivo = logging.StreamHandler(ArchivoLento(open(Path(tmp) / "cola.log", "w"), retraso))
+        archivo.setFormatter(main.FormatoJSON())
+        cola = main.ColaLog(args.lineas + 1)
+        cola.addFilter(main.FiltroRequestId())
+        oyente = logging.handlers.QueueListener(cola.queue, archivo)
+        oyente.start()
+
+        casos = {
+            "sincrono": _registrador("sincrono", sincrono),
+            "cola": _registrador("cola", cola),
+            "muestreado": _registrador("muestreado", cola, main.FiltroMuestreo(0.01)),
+        }
+        print(f"{'caso':<12} {'media µs':>10} {'p50 µs':>10} {'p99 µs':>10}")
+        for nombre, registrador in casos.items():
+            duraciones = _medir(registrador, args.lineas, args.hilos)
+            print(f"{nombre:<12} {statistics.fmean(duraciones):>10.2f} "
+                  f"{_percentil(duraciones, 0.5):>10.2f} {_percentil(duraciones, 0.99):>10.2f}")
+        oyente.stop()
+        print(f"descartados por cola llena: {cola.descartados}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,68 @@
+"""
+CPU ahorrado por el modo passthrough (PASSTHROUGH_JSON) frente a parsear y
+re-serializar el JSON del upstream.
+
+Para cada payload Inertia de los fixtures (el atributo data-page de
+dashboard_raw.html, perfil_raw.html, ...) y para los JSON del stub se mide:
+
+    parseado:    response.json() -> jsonable_encoder -> JSONResponse.render
+    passthrough: Response(content=bytes) con el content type del upstream
+
+Uso:
+    python bench/bench_passthrough.py [--repeticiones 200]
+
+Para ver el efecto de extremo a extremo, comparar
+    PASSTHROUGH_JSON=0 python bench/load_test.py
+    PASSTHROUGH_JSON=1 python bench/load_test.py
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bench.stub_upstream import JSONS, PANTALLAS_CARGADAS  # noqa: E402
+
+
+def _parseado(cuerpo: bytes) -> bytes:
+    return JSONResponse(jsonable_encoder(json.loads(cuerpo))).body
+
+
+def _passthrough(cuerpo: bytes) -> bytes:
+    return Response(content=cuerpo, media_type="application/json").body
+
+
+def _medir(funcion, cuerpo: bytes, repeticiones: int) -> float:
+    inicio = time.process_time()
+    for _ in range(repeticiones):
+        funcion(cuerpo)
+    return (time.process_time() - inicio) / repeticiones * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {ruta: page for ruta, (_, page) in PANTALLAS_CARGADAS.items()}
+    payloads.update(JSONS)
+
+    print(f"{'payload':<45} {'KB':>7} {'parseado µs':>12} {'passthrough µs':>15} {'ahorro':>8}")
+    total_parseado = total_passthrough = 0.0
+    for ruta, cuerpo in payloads.items():
+        parseado = _medir(_parseado, cuerpo, args.repeticiones)
+        passthrough = _medir(_passthrough, cuerpo, args.repeticiones)
+        total_parseado += parseado
+        total_passthrough += passthrough
+        ahorro = 100 * (1 - passthrough / parseado) if parseado else 0.0
+        print(f"{ruta:<45} {len(cuerpo) / 1024:>7.1f} {parseado:>12.1f} {passthrough:>15.1f} {ahorro:>7.1f}%")
+    print(f"{'total':<45} {'':>7} {total_parseado:>12.1f} {total_passthrough:>15.1f} "
+          f"{100 * (1 - total_passthrough / total_parseado):>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
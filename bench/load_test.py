@@ -0,0 +1,288 @@
+"""
+Prueba de carga reproducible de la API contra el stub local del portal.
+
+Levanta bench/stub_upstream.py y la app (main:app) como procesos uvicorn
+separados, con la app apuntando al stub (CEPREUNA_BASE_URL) y a una base
+SQLite temporal (DATABASE_URL). Cada usuario virtual hace login y recorre
+las rutas /api/page/*, /api/publicaciones y las rutas vocacionales. La carga
+se repite a concurrencia creciente y por cada nivel se reporta throughput,
+latencia p50/p99, errores y memoria (RSS pico) del proceso de la app.
+Las rutas async usan la base vía aiosqlite (pip install aiosqlite).
+
+Uso:
+    python bench/load_test.py
+    python bench/load_test.py --niveles 1,10,50 --requests 20 --latencia-ms 80
+    python bench/load_test.py --json resultados.json
+    python bench/load_test.py --comparar base.json --tolerancia 0.15
+
+Con --comparar el script termina con código 1 si el throughput cae o la
+latencia p99 sube más allá de la tolerancia respecto a la línea base, para
+usarlo como gate antes de un deploy.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# (método, ruta, payload) recorridos por cada usuario virtual en orden
+ESCENARIO = [
+    ("GET", "/api/verify-session", None),
+    ("GET", "/api/page/dashboard", None),
+    ("GET", "/api/page/perfil", None),
+    ("GET", "/api/page/horarios", None),
+    ("GET", "/api/page/mis-cursos", None),
+    ("GET", "/api/page/cuadernillos", None),
+    ("GET", "/api/page/asistencias", None),
+    ("GET", "/api/page/pagos", None),
+    ("GET", "/api/home", None),
+    ("GET", "/api/horario", None),
+    ("GET", "/api/asistencias", None),
+    ("GET", "/api/publicaciones?page=1&tipo=1", None),
+    ("GET", "/api/publicaciones?page=2&tipo=1", None),
+    ("GET", "/api/preguntas", None),
+    ("POST", "/api/respuestas/comprobar", {"data": {"dni": "12345678"}}),
+    ("POST", "/api/respuestasAll", {"json": {
+        "estudiante_id": 1,
+        "estudiante_nombre": "Estudiante Bench",
+        "estudiante_dni": "12345678",
+        "puntaje_ingeneria": 10,
+        "puntaje_biologia": 12,
+        "puntaje_sociales": 8,
+        "detalles": [],
+    }}),
+]
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for linea in f:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _esperar(url: str, timeout: float = 30.0):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} no respondió en {timeout}s")
+
+
+class Procesos:
+    """Stub upstream + app, cada uno en su propio proceso uvicorn."""
+
+    def __init__(self, latencia_ms: float, workers: int):
+        self.latencia_ms = latencia_ms
+        self.workers = workers
+        self.tmp = tempfile.TemporaryDirectory(prefix="cepreuna-bench-")
+        self.puerto_stub = _puerto_libre()
+        self.puerto_app = _puerto_libre()
+        self.stub = None
+        self.app = None
+
+    def __enter__(self):
+        env = dict(os.environ, STUB_LATENCY_MS=str(self.latencia_ms), PYTHONPATH=str(RAIZ))
+        self.stub = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "bench.stub_upstream:app",
+             "--port", str(self.puerto_stub), "--log-level", "warning"],
+            cwd=RAIZ, env=env,
+        )
+        stub_url = f"http://127.0.0.1:{self.puerto_stub}"
+        env_app = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{self.tmp.name}/bench.db",
+            CEPREUNA_BASE_URL=stub_url,
+            CEPREUNA_SISTEMAS_URL=stub_url,
+            SLOW_REQUEST_MS="1e9",
+            WEB_CONCURRENCY=str(self.workers),
+            CACHE_SQLITE_PATH=f"{self.tmp.name}/cache.sqlite",
+            CALENDARIO_SECRETO="bench",
+        )
+        # Como el release del Procfile: una sola migración antes de los workers
+        # (con AUTO_MIGRATE cada worker correría create_all a la vez)
+        subprocess.run([sys.executable, str(RAIZ / "main.py"), "migrate"],
+                       cwd=self.tmp.name, env=env_app, stdout=subprocess.DEVNULL, check=True)
+        # cwd temporal: la app no debe escribir nada sobre el árbol del repo
+        self.app = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", str(RAIZ),
+             "--port", str(self.puerto_app), "--workers", str(self.workers),
+             "--log-level", "warning"],
+            cwd=self.tmp.name, env=env_app, stdout=subprocess.DEVNULL,
+        )
+        _esperar(f"{stub_url}/")
+        _esperar(f"http://127.0.0.1:{self.puerto_app}/health/ready")
+        return self
+
+    def __exit__(self, *exc):
+        for proceso in (self.app, self.stub):
+            if proceso and proceso.poll() is None:
+                proceso.terminate()
+                try:
+                    proceso.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proceso.kill()
+        self.tmp.cleanup()
+
+    def rss_kb(self) -> int:
+        # Con --workers, uvicorn tiene un proceso supervisor y N hijos
+        pids = [self.app.pid]
+        try:
+            hijos = Path(f"/proc/{self.app.pid}/task/{self.app.pid}/children").read_text().split()
+            pids += [int(pid) for pid in hijos]
+        except OSError:
+            pass
+        return sum(_rss_kb(pid) for pid in pids)
+
+
+async def _usuario_virtual(cliente: httpx.AsyncClient, n: int, requests_por_usuario: int, latencias, errores):
+    inicio = time.perf_counter()
+    r = await cliente.post("/api/login", json={"email": f"bench{n}@cepreuna.edu.pe", "password": "bench"})
+    latencias.append((time.perf_counter() - inicio) * 1000)
+    if r.status_code != 200:
+        errores.append(("/api/login", r.status_code))
+        return
+    # La cookie es Secure y el bench corre sobre http: se reenvía a mano
+    headers = {"Cookie": f"session_id={r.cookies.get('session_id')}"}
+
+    for i in range(requests_por_usuario):
+        metodo, ruta, payload = ESCENARIO[i % len(ESCENARIO)]
+        inicio = time.perf_counter()
+        try:
+            r = await cliente.request(metodo, ruta, headers=headers, **(payload or {}))
+            if r.status_code >= 400:
+                errores.append((ruta, r.status_code))
+        except httpx.HTTPError as e:
+            errores.append((ruta, type(e).__name__))
+        latencias.append((time.perf_counter() - inicio) * 1000)
+
+
+def _percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    idx = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[idx]
+
+
+async def _nivel(procesos: Procesos, concurrencia: int, requests_por_usuario: int) -> dict:
+    latencias, errores = [], []
+    rss_pico = procesos.rss_kb()
+    midiendo = threading.Event()
+
+    def muestrear_memoria():
+        nonlocal rss_pico
+        while not midiendo.is_set():
+            rss_pico = max(rss_pico, procesos.rss_kb())
+            time.sleep(0.05)
+
+    hilo = threading.Thread(target=muestrear_memoria, daemon=True)
+    hilo.start()
+    limites = httpx.Limits(max_connections=concurrencia)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{procesos.puerto_app}", timeout=120.0, limits=limites
+    ) as cliente:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(
+            _usuario_virtual(cliente, n, requests_por_usuario, latencias, errores)
+            for n in range(concurrencia)
+        ))
+        duracion = time.perf_counter() - inicio
+    midiendo.set()
+    hilo.join()
+
+    return {
+        "concurrencia": concurrencia,
+        "requests": len(latencias),
+        "errores": len(errores),
+        "throughput_rps": round(len(latencias) / duracion, 2),
+        "p50_ms": round(_percentil(latencias, 50), 1),
+        "p99_ms": round(_percentil(latencias, 99), 1),
+        "media_ms": round(statistics.fmean(latencias), 1) if latencias else 0.0,
+        "rss_pico_mb": round(rss_pico / 1024, 1),
+    }
+
+
+def _imprimir(resultados):
+    columnas = ["concurrencia", "requests", "errores", "throughput_rps", "p50_ms", "p99_ms", "rss_pico_mb"]
+    print(" | ".join(f"{c:>14}" for c in columnas))
+    for r in resultados:
+        print(" | ".join(f"{r[c]:>14}" for c in columnas))
+
+
+def _comparar(resultados, base, tolerancia) -> list:
+    regresiones = []
+    base_por_nivel = {r["concurrencia"]: r for r in base["niveles"]}
+    for r in resultados:
+        b = base_por_nivel.get(r["concurrencia"])
+        if not b:
+            continue
+        if r["throughput_rps"] < b["throughput_rps"] * (1 - tolerancia):
+            regresiones.append(f"c={r['concurrencia']}: throughput {b['throughput_rps']} -> {r['throughput_rps']} rps")
+        if r["p99_ms"] > b["p99_ms"] * (1 + tolerancia):
+            regresiones.append(f"c={r['concurrencia']}: p99 {b['p99_ms']} -> {r['p99_ms']} ms")
+        if r["errores"] > b["errores"]:
+            regresiones.append(f"c={r['concurrencia']}: errores {b['errores']} -> {r['errores']}")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--niveles", default="1,5,10,25,50", help="concurrencias a probar, separadas por coma")
+    parser.add_argument("--requests", type=int, default=len(ESCENARIO), help="requests por usuario virtual (además del login)")
+    parser.add_argument("--latencia-ms", type=float, default=50.0, help="latencia simulada del upstream")
+    parser.add_argument("--workers", type=int, default=1, help="workers uvicorn de la app")
+    parser.add_argument("--json", help="guardar resultados en este archivo")
+    parser.add_argument("--comparar", help="archivo JSON de una corrida base")
+    parser.add_argument("--tolerancia", type=float, default=0.15)
+    args = parser.parse_args()
+
+    niveles = [int(n) for n in args.niveles.split(",")]
+    with Procesos(args.latencia_ms, args.workers) as procesos:
+        resultados = [asyncio.run(_nivel(procesos, c, args.requests)) for c in niveles]
+
+    _imprimir(resultados)
+    salida = {
+        "latencia_upstream_ms": args.latencia_ms,
+        "workers": args.workers,
+        "requests_por_usuario": args.requests,
+        "niveles": resultados,
+    }
+    if args.json:
+        Path(args.json).write_text(json.dumps(salida, indent=2))
+
+    if args.comparar:
+        regresiones = _comparar(resultados, json.loads(Path(args.comparar).read_text()), args.tolerancia)
+        for r in regresiones:
+            print(f"REGRESIÓN {r}")
+        if regresiones:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
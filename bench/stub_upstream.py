@@ -0,0 +1,274 @@
+"""
+Stub local del portal app.cepreuna.edu.pe (y de sistemas.cepreuna.edu.pe)
+para pruebas de carga sin tocar el servicio real.
+
+Sirve los fixtures HTML del repositorio (dashboard_raw.html, perfil_raw.html,
+horarios_raw.html, pagos.html, mis_cursos.html, cuadernillos.html) y, cuando
+llega el header X-Inertia, el JSON de su atributo data-page. Los endpoints JSON
+(get-horario, get-asistencias, get-publicaciones, ...) devuelven datos
+sintéticos deterministas.
+
+Uso:
+    STUB_LATENCY_MS=80 uvicorn bench.stub_upstream:app --port 8100
+
+Variables de entorno:
+    STUB_LATENCY_MS   latencia base añadida a cada respuesta (default 50)
+    STUB_JITTER_MS    variación aleatoria +/- sobre la latencia (default 10)
+    STUB_PUBLICACIONES_CADA_S
+                      si es > 0, aparece una publicación nueva cada tantos
+                      segundos (para probar /api/publicaciones/stream)
+"""
+import asyncio
+import html as html_module
+import json
+import os
+import random
+import re
+import time
+from pathlib import Path
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+LATENCIA_MS = float(os.getenv("STUB_LATENCY_MS", "50"))
+JITTER_MS = float(os.getenv("STUB_JITTER_MS", "10"))
+PUBLICACIONES_CADA_S = float(os.getenv("STUB_PUBLICACIONES_CADA_S", "0"))
+_INICIO = time.monotonic()
+
+XSRF_TOKEN = "stub-xsrf-token"
+INERTIA_VERSION = "2568bad1b63757e7a4e24f15bacf9fc6"
+
+# ruta upstream -> fixture HTML del repositorio
+PANTALLAS = {
+    "/dashboard": "dashboard_raw.html",
+    "/perfil": "perfil_raw.html",
+    "/estudiantes/horarios": "horarios_raw.html",
+    "/estudiantes/cursos/mis-cursos": "mis_cursos.html",
+    "/estudiantes/cursos/cuadernillos": "cuadernillos.html",
+    "/estudiantes/pagos": "pagos.html",
+    # No hay fixture de asistencias: se reutiliza el de horarios con otro componente
+    "/estudiantes/asistencias": "horarios_raw.html",
+}
+
+CURSOS = [
+    ("Aritmética", "#f44336"), ("Álgebra", "#e91e63"), ("Geometría", "#9c27b0"),
+    ("Trigonometría", "#673ab7"), ("Física", "#3f51b5"), ("Química", "#2196f3"),
+    ("Biología", "#009688"), ("Lenguaje", "#4caf50"), ("Literatura", "#ff9800"),
+    ("Historia", "#795548"),
+]
+DIAS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado"]
+
+_DATA_PAGE = re.compile(r'data-page="([^"]*)"')
+
+
+def _cargar_pantallas():
+    pantallas = {}
+    for ruta, archivo in PANTALLAS.items():
+        texto = (RAIZ / archivo).read_text(encoding="utf-8")
+        page = json.loads(html_module.unescape(_DATA_PAGE.search(texto).group(1)))
+        texto = texto.replace(page["version"], INERTIA_VERSION)
+        page["version"] = INERTIA_VERSION
+        page["url"] = ruta
+        if ruta == "/estudiantes/asistencias":
+            page["component"] = "Estudiante/Asistencia"
+            page["props"]["asistencias"] = _asistencias()
+        pantallas[ruta] = (texto, json.dumps(page).encode())
+    return pantallas
+
+
+def _horario():
+    rnd = random.Random(1)
+    bloques = []
+    for dia_idx, dia in enumerate(DIAS[:5]):
+        for bloque in range(4):
+            curso, color = CURSOS[(dia_idx * 4 + bloque) % len(CURSOS)]
+            inicio = 8 + bloque * 2
+            bloques.append({
+                "id": dia_idx * 10 + bloque + 1,
+                "dia": dia,
+                "hora_inicio": f"{inicio:02d}:00",
+                "hora_fin": f"{inicio + 1:02d}:40",
+                "curso": curso,
+                "color": color,
+                "docente": f"Docente {rnd.randint(1, 40)}",
+                "aula": f"A-{rnd.randint(101, 120)}",
+            })
+    return bloques
+
+
+def _asistencias():
+    rnd = random.Random(2)
+    registros = []
+    for semana in range(1, 9):
+        for dia in range(1, 6):
+            for curso, _ in CURSOS[:6]:
+                registros.append({
+                    "id": len(registros) + 1,
+                    "curso": curso,
+                    "fecha": f"2025-{4 + (semana * 7 + dia) // 30:02d}-{1 + (semana * 7 + dia) % 28:02d}",
+                    "estado": rnd.choices(["A", "F", "T"], weights=[85, 7, 8])[0],
+                })
+    return registros
+
+
+def _cuadernillos():
+    return {"cuadernillos": [
+        {
+            "id": i + 1,
+            "denominacion": curso,
+            "color": color,
+            "base_path": "https://app.cepreuna.edu.pe/storage/cuadernillos",
+            "cuadernillos": [
+                {"semana": semana, "path": f"{i + 1}/semana-{semana}.pdf"}
+                for semana in range(1, 9)
+            ],
+        }
+        for i, (curso, color) in enumerate(CURSOS)
+    ]}
+
+
+def _publicaciones(page: int, tipo: int):
+    por_pagina = 10
+    total = 120
+    if PUBLICACIONES_CADA_S > 0:
+        total += int((time.monotonic() - _INICIO) / PUBLICACIONES_CADA_S)
+    data = []
+    for i in range(por_pagina):
+        pub_id = total - ((page - 1) * por_pagina + i)
+        if pub_id <= 0:
+            break
+        data.append({
+            "id": pub_id,
+            "user_id": 1000 + pub_id % 17,
+            "tipo": tipo,
+            "texto": f"Publicación {pub_id} " + "lorem ipsum " * 20,
+            "imagen": None,
+            "created_at": "2025-05-01T12:00:00.000000Z",
+            "rol": {"id": 3, "name": "docente" if pub_id % 3 else "administrador"},
+        })
+    return {
+        "current_page": page,
+        "data": data,
+        "last_page": (total + por_pagina - 1) // por_pagina,
+        "per_page": por_pagina,
+        "total": total,
+    }
+
+
+JSONS = {
+    "/estudiantes/get-horario": _horario(),
+    "/estudiantes/cursos/get-carga": {"carga": [
+        {"curso": curso, "color": color, "horas": 4, "docente": f"Docente {i + 1}"}
+        for i, (curso, color) in enumerate(CURSOS)
+    ]},
+    "/estudiantes/get-asistencias": _asistencias(),
+    "/estudiantes/get-rango-fechas": {"fecha_inicio": "2025-04-01", "fecha_fin": "2025-07-31"},
+    "/estudiantes/cursos/get-cursos-estudiante": _cuadernillos(),
+}
+JSONS = {ruta: json.dumps(data).encode() for ruta, data in JSONS.items()}
+PANTALLAS_CARGADAS = _cargar_pantallas()
+
+app = FastAPI()
+
+
+@app.middleware("http")
+async def latencia(request: Request, call_next):
+    retraso = max(0.0, LATENCIA_MS + random.uniform(-JITTER_MS, JITTER_MS))
+    await asyncio.sleep(retraso / 1000)
+    return await call_next(request)
+
+
+def _json(cuerpo: bytes) -> Response:
+    return Response(content=cuerpo, media_type="application/json")
+
+
+@app.get("/")
+async def inicio():
+    response = HTMLResponse("<html><body>stub</body></html>")
+    response.set_cookie("XSRF-TOKEN", XSRF_TOKEN)
+    response.set_cookie("cepreuna_session", "stub-session", httponly=True)
+    return response
+
+
+@app.post("/login-singsuit")
+async def login(request: Request):
+    if request.headers.get("X-XSRF-TOKEN") != XSRF_TOKEN:
+        return JSONResponse(status_code=419, content={"message": "CSRF token mismatch."})
+    return {"success": True}
+
+
+@app.get("/estudiantes/cursos/get-criterios-docente")
+async def criterios_docente(modalidad: int = 1):
+    return [
+        {"curso": curso, "modalidad": modalidad, "criterio": "Evaluación continua", "peso": 25}
+        for curso, _ in CURSOS
+    ]
+
+
+@app.get("/get-publicaciones")
+async def publicaciones(page: int = 1, tipo: int = 1):
+    return _publicaciones(page, tipo)
+
+
+@app.get("/recursos/get-data-user")
+async def datos_usuario(id: int, idUser: int, rolName: str):
+    return {"datos": {
+        "id": idUser,
+        "nombres": f"Usuario {idUser}",
+        "rol": rolName,
+        "foto": f"https://app.cepreuna.edu.pe/storage/fotos/{idUser}.jpg",
+    }}
+
+
+@app.post("/crear-publicacion")
+async def crear_publicacion():
+    return {"success": True, "id": random.randint(1000, 9999)}
+
+
+@app.post("/estudiantes/registrar-pago-cuota")
+async def registrar_pago_cuota():
+    return {"success": True, "message": "Pago registrado"}
+
+
+@app.post("/api/pagos/validar-pago-cuota/{user_id}")
+async def validar_pago_cuota(user_id: int):
+    return {"success": True, "token": f"tok-{user_id}-{random.randint(0, 10 ** 6)}"}
+
+
+@app.get("/estudiantes/constancia-test/{estudiante_id}")
+async def constancia(estudiante_id: int):
+    return Response(content=b"%PDF-1.4\n% stub\n" + b"0" * 20_000, media_type="application/pdf")
+
+
+@app.get("/storage/cuadernillos/{ruta:path}")
+async def cuadernillo_pdf(ruta: str, request: Request):
+    contenido = b"%PDF-1.4\n% cuadernillo " + ruta.encode() + b"\n" + bytes(range(256)) * 2000
+    etag = f'"{hash(ruta) & 0xffffffff:08x}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=contenido, media_type="application/pdf", headers={
+        "ETag": etag,
+        "Last-Modified": "Mon, 05 May 2025 12:00:00 GMT",
+    })
+
+
+@app.get("/{ruta:path}")
+async def pantalla_o_json(ruta: str, request: Request):
+    ruta = "/" + ruta
+    if ruta in JSONS:
+        return _json(JSONS[ruta])
+    if ruta in PANTALLAS_CARGADAS:
+        texto, page = PANTALLAS_CARGADAS[ruta]
+        if request.headers.get("X-Inertia") == "true":
+            # Igual que Inertia: versión desactualizada -> 409 con la URL a recargar
+            if request.headers.get("X-Inertia-Version") != INERTIA_VERSION:
+                return Response(status_code=409, headers={"X-Inertia-Location": str(request.url)})
+            return Response(
+                content=page,
+                media_type="application/json",
+                headers={"X-Inertia": "true", "Vary": "X-Inertia"},
+            )
+        return HTMLResponse(texto)
+    return JSONResponse(status_code=404, content={"message": "Not Found"})
@@ -0,0 +1,93 @@
+"""
+Fixtures compartidos: la app (main) contra bench/stub_upstream.py, que corre
+en un hilo con uvicorn, y una base SQLite temporal.
+
+La configuración de main se lee al importar, así que las variables de entorno
+se fijan aquí antes de que cualquier test lo importe.
+"""
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+_TMP = tempfile.mkdtemp(prefix="cepreuna-tests-")
+PUERTO_STUB = _puerto_libre()
+STAFF_EMAIL = "staff@cepreuna.edu.pe"
+
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_TMP}/tests.db",
+    CEPREUNA_BASE_URL=f"http://127.0.0.1:{PUERTO_STUB}",
+    CEPREUNA_SISTEMAS_URL=f"http://127.0.0.1:{PUERTO_STUB}",
+    CEPREUNA_DATA_DIR=f"{_TMP}/data",
+    CALENDARIO_SECRETO="tests",
+    EXPORT_EMAILS=STAFF_EMAIL,
+    AUTO_MIGRATE="1",
+    SLOW_REQUEST_MS="1e9",
+    STUB_LATENCY_MS="0",
+    STUB_JITTER_MS="0",
+)
+
+import uvicorn  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bench import stub_upstream  # noqa: E402
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def stub():
+    servidor = uvicorn.Server(uvicorn.Config(stub_upstream.app, port=PUERTO_STUB, log_level="warning"))
+    hilo = threading.Thread(target=servidor.run, daemon=True)
+    hilo.start()
+    limite = time.monotonic() + 10
+    while not servidor.started:
+        if time.monotonic() > limite:
+            raise RuntimeError("el stub upstream no arrancó")
+        time.sleep(0.05)
+    yield stub_upstream
+    servidor.should_exit = True
+    hilo.join(timeout=5)
+
+
+@pytest.fixture(scope="session")
+def _cliente_app(stub):
+    # La cookie de sesión es Secure: el cliente tiene que hablar https
+    with TestClient(main.app, base_url="https://testserver") as cliente:
+        yield cliente
+
+
+@pytest.fixture
+def cliente(_cliente_app):
+    """Cliente sin sesión; un solo TestClient para que el engine async viva en un solo loop."""
+    _cliente_app.cookies.clear()
+    yield _cliente_app
+    _cliente_app.cookies.clear()
+
+
+def iniciar_sesion(cliente, email: str = "estudiante@cepreuna.edu.pe") -> str:
+    cliente.cookies.clear()
+    respuesta = cliente.post("/api/login", json={"email": email, "password": "tests"})
+    assert respuesta.status_code == 200, respuesta.text
+    return cliente.cookies["session_id"]
+
+
+@pytest.fixture
+def sesion(cliente):
+    """Cliente con una sesión de estudiante recién iniciada."""
+    iniciar_sesion(cliente)
+    return cliente
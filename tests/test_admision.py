@@ -0,0 +1,38 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def ocupado(monkeypatch):
+    """Worker con el 75% de ADMISION_MAX_EN_VUELO en vuelo: se descarta baja, pasa normal."""
+    monkeypatch.setattr(main.control_admision, "en_vuelo", int(main.control_admision.max_en_vuelo * 0.75))
+
+
+def test_baja_prioridad_se_rechaza_con_retry_after(sesion, ocupado):
+    respuesta = sesion.get("/api/publicaciones", params={"page": 1, "tipo": 1})
+    assert respuesta.status_code == 503
+    assert respuesta.headers["Retry-After"] == str(main.UMBRALES_ADMISION["baja"][2])
+
+
+def test_prefetch_del_navegador_es_baja_prioridad(sesion, ocupado):
+    assert sesion.get("/api/horario", headers={"Sec-Purpose": "prefetch"}).status_code == 503
+
+
+def test_normal_y_critica_siguen_pasando(sesion, ocupado):
+    assert sesion.get("/api/horario").status_code == 200
+    assert sesion.get("/health/live").status_code == 200
+
+
+def test_con_lag_alto_se_rechaza_normal_pero_no_critica(sesion, monkeypatch):
+    monkeypatch.setattr(main.control_admision, "lag_ms", 1e9)
+    respuesta = sesion.get("/api/horario")
+    assert respuesta.status_code == 503
+    assert respuesta.headers["Retry-After"] == str(main.UMBRALES_ADMISION["normal"][2])
+    assert sesion.post("/api/logout").status_code == 200
+
+
+def test_rechazos_en_metricas(sesion, ocupado):
+    antes = main.control_admision.rechazados["baja"]
+    sesion.get("/api/publicaciones")
+    assert sesion.get("/api/metrics").json()["admision"]["rechazados"]["baja"] == antes + 1
@@ -0,0 +1,34 @@
+import time
+
+import main
+
+
+def test_expiradas_se_barren_sin_volver_a_leerlas():
+    almacen = main.AlmacenMemoria(max_bytes=10 ** 9)
+    for i in range(1000):
+        almacen.set("sesiones", str(i), {"id": i}, ttl=0.01)
+    time.sleep(0.02)
+    for i in range(100):
+        almacen.agregar("scroll", str(i), True, ttl=60)
+
+    assert len(almacen._entradas) == 100
+    assert almacen._bytes == 100 * main.AlmacenMemoria.ENTRADA_MIN_BYTES
+
+
+def test_entradas_sin_tamano_quedan_acotadas_por_lru():
+    almacen = main.AlmacenMemoria(max_bytes=10 * main.AlmacenMemoria.ENTRADA_MIN_BYTES)
+    for i in range(50):
+        almacen.set("autores", str(i), i, ttl=600)
+
+    assert len(almacen._entradas) == 10
+    assert almacen.get("autores", "0") is None
+    assert almacen.get("autores", "49") == 49
+
+
+def test_serializar_ida_y_vuelta():
+    valor = {"b": b"\x00\xff", "lista": [1, "dos"], "entrada": main.EntradaCache(b"x", "application/json")}
+    copia = main.deserializar(main.serializar(valor))
+    assert copia["b"] == valor["b"]
+    assert copia["lista"] == valor["lista"]
+    assert isinstance(copia["entrada"], main.EntradaCache)
+    assert copia["entrada"].etag == valor["entrada"].etag
@@ -0,0 +1,71 @@
+from urllib.parse import urlsplit
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def feed(sesion):
+    """Ruta del .ics de la sesión de estudiante, ya generado."""
+    cuerpo = sesion.get("/api/horario/calendario").json()
+    assert cuerpo["webcal"].startswith("webcal://")
+    return urlsplit(cuerpo["url"]).path
+
+
+def test_token_valido_sirve_el_ics(cliente, feed):
+    # Las apps de calendario no mandan la cookie: basta el token de la URL
+    cliente.cookies.clear()
+    respuesta = cliente.get(feed)
+
+    assert respuesta.status_code == 200
+    assert respuesta.headers["Content-Type"].startswith("text/calendar")
+    assert respuesta.text.startswith("BEGIN:VCALENDAR\r\n")
+    assert respuesta.text.count("BEGIN:VEVENT") == 20
+    assert "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20250731T235959Z" in respuesta.text
+
+
+def test_token_es_hmac_del_email(feed):
+    token = main.token_calendario("estudiante@cepreuna.edu.pe")
+    assert feed.endswith(f"/{token}.ics")
+    assert main.token_calendario("ESTUDIANTE@cepreuna.edu.pe") == token
+    assert main.token_calendario("otro@cepreuna.edu.pe") != token
+
+
+@pytest.mark.parametrize("token", [
+    main.token_calendario("otro@cepreuna.edu.pe"),
+    "0" * 32,
+    "no-es-hex",
+])
+def test_token_ajeno_o_invalido_es_404(cliente, feed, token):
+    assert cliente.get(f"/api/calendario/{token}.ics").status_code == 404
+
+
+def test_token_firmado_con_otro_secreto_es_404(cliente, feed, monkeypatch):
+    monkeypatch.setattr(main, "CALENDARIO_SECRETO", "otro-secreto")
+    token = main.token_calendario("estudiante@cepreuna.edu.pe")
+    monkeypatch.undo()
+    assert cliente.get(f"/api/calendario/{token}.ics").status_code == 404
+
+
+def test_if_none_match_304(cliente, feed):
+    etag = cliente.get(feed).headers["ETag"]
+    respuesta = cliente.get(feed, headers={"If-None-Match": etag})
+    assert respuesta.status_code == 304
+    assert respuesta.content == b""
+
+
+def test_sin_secreto_el_calendario_responde_503(sesion, feed, monkeypatch):
+    monkeypatch.setattr(main, "CALENDARIO_SECRETO", "")
+    assert sesion.get("/api/horario/calendario").status_code == 503
+    assert sesion.get(feed).status_code == 503
+    assert sesion.get("/api/horario").status_code == 200
+
+
+def test_bloques_no_reconocidos_se_registran(monkeypatch):
+    avisos = []
+    monkeypatch.setattr(main.logger, "warning", avisos.append)
+    ics = main.generar_ical("t", [{"day": "lunes", "inicio": "08:00"}], None, None)
+
+    assert b"BEGIN:VEVENT" not in ics
+    assert len(avisos) == 1 and "'day'" in avisos[0]
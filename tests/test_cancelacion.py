@@ -0,0 +1,93 @@
+"""
+El cliente se desconecta a mitad de un GET: el request se habla directo por
+ASGI (TestClient no sabe cortar la conexión) en el loop del cliente de la
+suite, con un receive que entrega http.disconnect pasado un rato.
+"""
+import asyncio
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def upstream_lento(stub, monkeypatch):
+    monkeypatch.setattr(stub, "LATENCIA_MS", 300)
+
+
+@pytest.fixture
+def llamadas_upstream(monkeypatch):
+    """Cuenta las llamadas al upstream que llegaron a completarse."""
+    llamadas = []
+    registrar = main.latencia_upstream.registrar
+    monkeypatch.setattr(main.latencia_upstream, "registrar", lambda ms: (llamadas.append(ms), registrar(ms)))
+    return llamadas
+
+
+def _get_abortado(cliente, ruta: str, abortar_tras: float):
+    """GET que se desconecta a los `abortar_tras` segundos; devuelve (status, duración)."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "https", "path": ruta, "raw_path": ruta.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"cookie", f"session_id={cliente.cookies['session_id']}".encode())],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 443),
+    }
+    enviados = []
+
+    async def correr():
+        primero = True
+
+        async def receive():
+            nonlocal primero
+            if primero:
+                primero = False
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.sleep(abortar_tras)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            enviados.append(message)
+
+        inicio = time.perf_counter()
+        await main.app(scope, receive, send)
+        return time.perf_counter() - inicio
+
+    duracion = cliente.portal.call(correr)
+    return enviados[0]["status"], duracion
+
+
+def test_desconexion_corta_la_cadena_del_upstream(sesion, upstream_lento, llamadas_upstream):
+    antes = sesion.get("/api/metrics").json()["cancelacion"]
+
+    # /api/page/horarios son dos llamadas seguidas (HTML y luego Inertia): ~600 ms completo
+    status, duracion = _get_abortado(sesion, "/api/page/horarios", abortar_tras=0.1)
+
+    assert status == 499
+    assert duracion < 0.55
+    # La primera llamada ya estaba en vuelo y se descartó; la segunda nunca salió
+    assert len(llamadas_upstream) == 1
+    despues = sesion.get("/api/metrics").json()["cancelacion"]
+    assert despues["desconexiones"] == antes["desconexiones"] + 1
+    assert despues["respuestas_descartadas"] == antes["respuestas_descartadas"] + 1
+
+
+def test_desconexion_mientras_espera_turno_deja_la_fila(sesion, llamadas_upstream, monkeypatch):
+    limitador = main.LimitadorUpstream(1)
+    limitador.adquirir("ocupante")
+    monkeypatch.setattr(main, "limitador_upstream", limitador)
+    monkeypatch.setattr(main.latencia_upstream, "ewma_ms", 100.0)
+    antes = main.metricas_cancelacion["esperas_abortadas"]
+
+    status, duracion = _get_abortado(sesion, "/api/horario", abortar_tras=0.1)
+
+    assert status == 499
+    assert duracion < 1
+    assert llamadas_upstream == []
+    assert limitador.en_cola == 0 and limitador.en_uso == 1
+    assert main.metricas_cancelacion["esperas_abortadas"] == antes + 1
+
+
+def test_sin_desconexion_el_request_termina_normal(sesion, upstream_lento):
+    status, _ = _get_abortado(sesion, "/api/page/horarios", abortar_tras=5)
+    assert status == 200
@@ -0,0 +1,99 @@
+import pytest
+
+import main
+
+RUTA = "3/semana-2.pdf"
+URL = f"/api/cuadernillos/file/{RUTA}"
+
+
+def _contenido(ruta: str) -> bytes:
+    # Lo mismo que sirve bench/stub_upstream.py en /storage/cuadernillos/<ruta>
+    return b"%PDF-1.4\n% cuadernillo " + ruta.encode() + b"\n" + bytes(range(256)) * 2000
+
+
+@pytest.fixture
+def archivo(sesion):
+    completo = sesion.get(URL)
+    assert completo.status_code == 200
+    return completo
+
+
+def test_archivo_completo(archivo):
+    assert archivo.content == _contenido(RUTA)
+    assert archivo.headers["Accept-Ranges"] == "bytes"
+    assert archivo.headers["Content-Length"] == str(len(_contenido(RUTA)))
+    assert archivo.headers["ETag"]
+
+
+@pytest.mark.parametrize("rango, inicio, fin", [
+    ("bytes=0-99", 0, 99),
+    ("bytes=1000-", 1000, None),
+    ("bytes=-500", -500, None),
+    ("bytes=500000-999999999", 500000, None),
+])
+def test_rango_206(sesion, archivo, rango, inicio, fin):
+    contenido = _contenido(RUTA)
+    esperado = contenido[inicio:] if fin is None else contenido[inicio:fin + 1]
+
+    respuesta = sesion.get(URL, headers={"Range": rango})
+
+    assert respuesta.status_code == 206
+    assert respuesta.content == esperado
+    primero = inicio if inicio >= 0 else len(contenido) + inicio
+    assert respuesta.headers["Content-Range"] == f"bytes {primero}-{primero + len(esperado) - 1}/{len(contenido)}"
+    assert respuesta.headers["Content-Length"] == str(len(esperado))
+
+
+def test_rango_fuera_del_archivo_es_416(sesion, archivo):
+    tamano = len(_contenido(RUTA))
+    respuesta = sesion.get(URL, headers={"Range": f"bytes={tamano}-"})
+
+    assert respuesta.status_code == 416
+    assert respuesta.headers["Content-Range"] == f"bytes */{tamano}"
+    assert respuesta.content == b""
+
+
+def test_multirango_se_sirve_completo(sesion, archivo):
+    respuesta = sesion.get(URL, headers={"Range": "bytes=0-9,20-29"})
+    assert respuesta.status_code == 200
+    assert respuesta.content == _contenido(RUTA)
+
+
+def test_if_range_con_etag_viejo_ignora_el_rango(sesion, archivo):
+    respuesta = sesion.get(URL, headers={"Range": "bytes=0-9", "If-Range": '"otro"'})
+    assert respuesta.status_code == 200
+    assert respuesta.content == _contenido(RUTA)
+
+
+def test_if_range_con_etag_vigente_respeta_el_rango(sesion, archivo):
+    respuesta = sesion.get(URL, headers={"Range": "bytes=0-9", "If-Range": archivo.headers["ETag"]})
+    assert respuesta.status_code == 206
+    assert respuesta.content == _contenido(RUTA)[:10]
+
+
+def test_if_none_match_304(sesion, archivo):
+    respuesta = sesion.get(URL, headers={"If-None-Match": archivo.headers["ETag"]})
+    assert respuesta.status_code == 304
+    assert respuesta.content == b""
+
+
+def test_ruta_con_punto_punto_no_llega_al_upstream(sesion):
+    assert sesion.get("/api/cuadernillos/file/3/../../secreto.pdf").status_code in (400, 404)
+    assert not main.ruta_cuadernillo_valida("3/../secreto.pdf")
+
+
+def test_sin_sesion_es_403(cliente):
+    assert cliente.get(URL).status_code == 403
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (None, None),
+    ("items=0-1", None),
+    ("bytes=abc-", None),
+    ("bytes=5-2", "invalido"),
+    ("bytes=-0", "invalido"),
+    ("bytes=0-", (0, 99)),
+    ("bytes=90-200", (90, 99)),
+])
+def test_rango_solicitado(valor, esperado):
+    assert main.rango_solicitado(valor, 100) == esperado
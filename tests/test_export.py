@@ -0,0 +1,71 @@
+import csv
+import io
+import uuid
+
+import pytest
+
+import main
+from conftest import STAFF_EMAIL, iniciar_sesion
+
+
+@pytest.fixture
+def respuesta_guardada(cliente):
+    dni = uuid.uuid4().hex[:8]
+    iniciar_sesion(cliente)
+    guardada = cliente.post("/api/respuestasAll", json={
+        "estudiante_id": 7,
+        "estudiante_nombre": "Estudiante Export",
+        "estudiante_dni": dni,
+        "puntaje_ingeneria": 11,
+        "puntaje_biologia": 12,
+        "puntaje_sociales": 13,
+        "detalles": [
+            {"nro_documento": dni, "puntaje": p, "tipo": "A", "preguntas_id": p, "respuesta_id": 0}
+            for p in (1, 2)
+        ],
+    })
+    assert guardada.status_code == 200
+    cliente.cookies.clear()
+    return dni
+
+
+def test_sin_sesion_es_401(cliente):
+    respuesta = cliente.get("/api/respuestas/export")
+    assert respuesta.status_code == 401
+    assert "estudiante_dni" not in respuesta.text
+
+
+def test_sesion_invalida_es_401(cliente):
+    cliente.cookies.set("session_id", "no-existe")
+    assert cliente.get("/api/respuestas/export").status_code == 401
+
+
+def test_estudiante_no_puede_exportar(cliente, respuesta_guardada):
+    iniciar_sesion(cliente, "estudiante@cepreuna.edu.pe")
+    respuesta = cliente.get("/api/respuestas/export")
+    assert respuesta.status_code == 403
+    assert respuesta_guardada not in respuesta.text
+
+
+def test_staff_exporta_csv(cliente, respuesta_guardada):
+    iniciar_sesion(cliente, STAFF_EMAIL.upper())
+    respuesta = cliente.get("/api/respuestas/export")
+
+    assert respuesta.status_code == 200
+    assert respuesta.headers["Content-Type"].startswith("text/csv")
+    filas = list(csv.DictReader(io.StringIO(respuesta.text)))
+    assert list(filas[0]) == list(main.COLUMNAS_EXPORT)
+    propias = [f for f in filas if f["estudiante_dni"] == respuesta_guardada]
+    assert sorted(f["pregunta_id"] for f in propias) == ["1", "2"]
+    assert {f["puntaje_sociales"] for f in propias} == {"13"}
+
+
+def test_staff_exporta_parquet(cliente, respuesta_guardada):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    iniciar_sesion(cliente, STAFF_EMAIL)
+    respuesta = cliente.get("/api/respuestas/export", params={"format": "parquet"})
+
+    assert respuesta.status_code == 200
+    tabla = pyarrow_parquet.read_table(io.BytesIO(respuesta.content))
+    assert tabla.column_names == list(main.COLUMNAS_EXPORT)
+    assert respuesta_guardada in tabla.column("estudiante_dni").to_pylist()
@@ -0,0 +1,86 @@
+import uuid
+
+from conftest import iniciar_sesion
+
+
+def _respuesta(dni: str, puntaje: int = 10) -> dict:
+    return {
+        "estudiante_id": 1,
+        "estudiante_nombre": "Estudiante Test",
+        "estudiante_dni": dni,
+        "puntaje_ingeneria": puntaje,
+        "puntaje_biologia": 12,
+        "puntaje_sociales": 8,
+        "detalles": [{"nro_documento": dni, "puntaje": 3, "tipo": "A", "preguntas_id": 1, "respuesta_id": 0}],
+    }
+
+
+def _filas(cliente, dni: str) -> int:
+    return sum(1 for r in cliente.get("/api/respuestas").json() if r["estudiante_dni"] == dni)
+
+
+def test_reintento_devuelve_la_respuesta_guardada(sesion):
+    dni = uuid.uuid4().hex[:8]
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    primera = sesion.post("/api/respuestasAll", json=_respuesta(dni), headers=headers)
+    reintento = sesion.post("/api/respuestasAll", json=_respuesta(dni), headers=headers)
+
+    assert primera.status_code == 200
+    assert "Idempotent-Replayed" not in primera.headers
+    assert reintento.status_code == 200
+    assert reintento.headers["Idempotent-Replayed"] == "true"
+    assert reintento.json() == primera.json()
+    assert _filas(sesion, dni) == 1
+
+
+def test_misma_clave_con_otro_contenido_es_422(sesion):
+    dni = uuid.uuid4().hex[:8]
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    assert sesion.post("/api/respuestasAll", json=_respuesta(dni), headers=headers).status_code == 200
+    conflicto = sesion.post("/api/respuestasAll", json=_respuesta(dni, puntaje=99), headers=headers)
+
+    assert conflicto.status_code == 422
+    assert _filas(sesion, dni) == 1
+
+
+def test_clave_demasiado_larga_es_400(sesion):
+    respuesta = sesion.post("/api/respuestasAll", json=_respuesta("1"), headers={"Idempotency-Key": "x" * 256})
+    assert respuesta.status_code == 400
+
+
+def test_sin_clave_cada_envio_se_guarda(sesion):
+    dni = uuid.uuid4().hex[:8]
+    a = sesion.post("/api/respuestasAll", json=_respuesta(dni))
+    b = sesion.post("/api/respuestasAll", json=_respuesta(dni))
+    assert a.json()["respuesta_id"] != b.json()["respuesta_id"]
+    assert _filas(sesion, dni) == 2
+
+
+def test_la_clave_es_por_sesion(cliente):
+    dni = uuid.uuid4().hex[:8]
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    iniciar_sesion(cliente)
+    a = cliente.post("/api/respuestasAll", json=_respuesta(dni), headers=headers)
+    iniciar_sesion(cliente)
+    b = cliente.post("/api/respuestasAll", json=_respuesta(dni), headers=headers)
+
+    assert "Idempotent-Replayed" not in b.headers
+    assert a.json()["respuesta_id"] != b.json()["respuesta_id"]
+
+
+def test_registrar_pago_reintento_no_repite_el_upstream(sesion):
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    primera = sesion.post("/api/registrar-pago", json={"tokens": ["tok-1"]}, headers=headers)
+    reintento = sesion.post("/api/registrar-pago", json={"tokens": ["tok-1"]}, headers=headers)
+
+    assert primera.status_code == 200
+    assert reintento.headers["Idempotent-Replayed"] == "true"
+    assert reintento.content == primera.content
+
+
+def test_sin_sesion_es_403(cliente):
+    respuesta = cliente.post("/api/respuestasAll", json=_respuesta("1"), headers={"Idempotency-Key": "k"})
+    assert respuesta.status_code == 403
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def latencia_conocida(monkeypatch):
+    # La espera estimada depende de la latencia medida del upstream: 100 ms por llamada
+    monkeypatch.setattr(main.latencia_upstream, "ewma_ms", 100.0)
+
+
+def _esperar(condicion, limite=5.0):
+    fin = time.monotonic() + limite
+    while not condicion():
+        assert time.monotonic() < fin, "timeout esperando al limitador"
+        time.sleep(0.001)
+
+
+def _encolar(limitador, session_id, atendidos):
+    """Lanza un hilo que espera turno y anota su session_id al conseguir el cupo."""
+    en_cola = limitador.en_cola
+    hilo = threading.Thread(target=lambda: (limitador.adquirir(session_id), atendidos.append(session_id)), daemon=True)
+    hilo.start()
+    _esperar(lambda: limitador.en_cola == en_cola + 1)
+    return hilo
+
+
+def test_una_sesion_no_acapara_la_fila():
+    limitador = main.LimitadorUpstream(1)
+    limitador.adquirir("ocupante")
+    atendidos = []
+    hilos = [_encolar(limitador, "insistente", atendidos) for _ in range(5)]
+    hilos += [_encolar(limitador, "otra", atendidos), _encolar(limitador, "tercera", atendidos)]
+
+    for n in range(1, len(hilos) + 1):
+        limitador.liberar()
+        _esperar(lambda: len(atendidos) == n)
+
+    # Round robin por sesión: "otra" y "tercera" no esperan a las cinco de "insistente"
+    assert atendidos[:3] == ["insistente", "otra", "tercera"]
+    assert atendidos[3:] == ["insistente"] * 4
+    assert limitador.en_cola == 0 and not limitador._colas
+    for hilo in hilos:
+        hilo.join(1)
+
+
+def test_con_cupo_libre_no_hay_espera():
+    limitador = main.LimitadorUpstream(2)
+    limitador.adquirir("a", time.perf_counter())
+    limitador.adquirir("b", time.perf_counter())
+    assert limitador.en_uso == 2
+    assert limitador.encolados == 0
+
+
+def test_sin_cupo_y_espera_mayor_al_plazo_rechaza_de_inmediato():
+    limitador = main.LimitadorUpstream(1)
+    limitador.adquirir("ocupante")
+
+    inicio = time.perf_counter()
+    with pytest.raises(main.UpstreamSaturado) as error:
+        limitador.adquirir("tarde", inicio + 0.01)
+
+    assert time.perf_counter() - inicio < 0.05
+    assert error.value.espera_estimada == pytest.approx(0.1)
+    assert limitador.rechazados == 1
+    assert limitador.en_cola == 0
+
+
+def test_vencido_el_plazo_en_la_fila_sale_con_upstream_saturado():
+    limitador = main.LimitadorUpstream(1)
+    limitador.adquirir("ocupante")
+
+    with pytest.raises(main.UpstreamSaturado):
+        limitador.adquirir("paciente", time.perf_counter() + 0.15)
+
+    assert limitador.encolados == 1 and limitador.rechazados == 1
+    assert limitador.en_cola == 0 and not limitador._colas
+    # El cupo no se perdió: al liberarlo vuelve a estar disponible
+    limitador.liberar()
+    limitador.adquirir("siguiente", time.perf_counter())
+
+
+@pytest.fixture
+def upstream_lleno(monkeypatch):
+    limitador = main.LimitadorUpstream(1)
+    limitador.adquirir("ocupante")
+    monkeypatch.setattr(main, "limitador_upstream", limitador)
+    monkeypatch.setattr(main, "UPSTREAM_PLAZO_SEGUNDOS", 0.01)
+    return limitador
+
+
+def test_saturacion_responde_503_con_retry_after(sesion, upstream_lleno):
+    respuesta = sesion.get("/api/horario")
+    assert respuesta.status_code == 503
+    assert respuesta.headers["Retry-After"] == "1"
+    assert upstream_lleno.rechazados >= 1
+
+
+def test_crear_publicacion_no_oculta_la_saturacion(sesion, upstream_lleno):
+    respuesta = sesion.post("/api/crear-publicacion", data={"usuario": "{}", "texto": "hola", "tipo": "1"})
+    assert respuesta.status_code == 503
+    assert respuesta.headers["Retry-After"] == "1"
@@ -0,0 +1,41 @@
+import main
+
+URL = "/api/pagos/1/lote"
+
+
+def _lote(n, **cambios):
+    campos = {
+        "pagarEnPagalo": ["true"] * n,
+        "secuencia": [f"S{i}" for i in range(n)],
+        "monto": ["150.0"] * n,
+        "fecha": ["2025-07-01"] * n,
+        "documento": [f"D{i}" for i in range(n)],
+    }
+    campos.update(cambios)
+    archivos = [("files", (f"voucher-{i}.jpg", b"\xff\xd8" + bytes([i]) * 64, "image/jpeg")) for i in range(n)]
+    return {"data": campos, "files": archivos}
+
+
+def test_lote_valida_cada_comprobante(sesion):
+    cuerpo = sesion.post(URL, **_lote(3)).json()
+
+    assert cuerpo["success"] is True
+    assert [r["indice"] for r in cuerpo["resultados"]] == [0, 1, 2]
+    assert [r["secuencia"] for r in cuerpo["resultados"]] == ["S0", "S1", "S2"]
+    assert cuerpo["tokens"] == [r["token"] for r in cuerpo["resultados"]]
+    assert all(t.startswith("tok-1-") for t in cuerpo["tokens"])
+
+
+def test_campos_desparejos_es_400(sesion):
+    respuesta = sesion.post(URL, **_lote(2, secuencia=["S0"]))
+    assert respuesta.status_code == 400
+
+
+def test_mas_del_maximo_es_400(sesion):
+    respuesta = sesion.post(URL, **_lote(main.PAGOS_LOTE_MAX + 1))
+    assert respuesta.status_code == 400
+    assert str(main.PAGOS_LOTE_MAX) in respuesta.json()["error"]
+
+
+def test_sin_sesion_es_403(cliente):
+    assert cliente.post(URL, **_lote(1)).status_code == 403
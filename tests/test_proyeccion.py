@@ -0,0 +1,39 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def dashboard(sesion):
+    return sesion.get("/api/page/dashboard").json()
+
+
+def test_fields_devuelve_solo_esos_props(sesion, dashboard):
+    cuerpo = sesion.get("/api/page/dashboard", params={"fields": "user.id,props.user.email,usuario"}).json()
+
+    assert cuerpo["component"] == dashboard["component"]
+    assert set(cuerpo["props"]) == {"user", "usuario"}
+    assert cuerpo["props"]["user"] == {k: dashboard["props"]["user"][k] for k in ("id", "email")}
+    assert cuerpo["props"]["usuario"] == dashboard["props"]["usuario"]
+
+
+def test_perfil_movil(sesion, dashboard):
+    cuerpo = sesion.get("/api/page/dashboard", params={"profile": "movil"}).json()
+    esperado = main.proyectar(dashboard["props"], main.PERFILES_PROYECCION["dashboard"]["movil"])
+    assert cuerpo["props"] == esperado
+
+
+@pytest.mark.parametrize("params", [
+    {"profile": "no-existe"},
+    {"fields": " , "},
+    {"fields": ",".join(f"c{i}" for i in range(main.MAX_CAMPOS_PROYECCION + 1))},
+])
+def test_proyeccion_invalida_es_400(sesion, params):
+    assert sesion.get("/api/page/dashboard", params=params).status_code == 400
+
+
+def test_proyectar_recorre_listas():
+    datos = {"cursos": [{"id": 1, "nombre": "A", "docente": {"id": 9, "dni": "x"}}, "suelto"], "otro": 1}
+    assert main.proyectar(datos, ["cursos.id", "cursos.docente.id", "falta.algo"]) == {
+        "cursos": [{"id": 1, "docente": {"id": 9}}, "suelto"],
+    }
@@ -0,0 +1,125 @@
+"""
+Sesiones selladas (SESION_MODO=sellada). El modo se fija al importar main y el
+resto de la suite corre con la tabla Sesion, así que aquí se activa a mano:
+claves Fernet nuevas, SesionesSelladas propio y la app envuelta en
+SesionSelladaMiddleware, igual que la registra main con el modo sellado.
+"""
+import pytest
+
+fernet = pytest.importorskip("cryptography.fernet")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from conftest import STAFF_EMAIL, iniciar_sesion  # noqa: E402
+
+CLAVE_ANTERIOR = fernet.Fernet.generate_key().decode()
+CLAVE_NUEVA = fernet.Fernet.generate_key().decode()
+
+
+def _selladas(*claves):
+    return main.SesionesSelladas(list(claves), main.SESION_LOCALES_MAX)
+
+
+def _sesion(email="estudiante@cepreuna.edu.pe"):
+    return main.Sesion(id="sid-1", email=email, cookies='{"XSRF-TOKEN": "x"}')
+
+
+@pytest.fixture
+def modo_sellado(monkeypatch, _cliente_app):
+    # _cliente_app: la app ya arrancó (lifespan y migraciones) contra el stub
+    monkeypatch.setattr(main, "SESION_MODO", "sellada")
+    for nombre in ("Fernet", "MultiFernet", "InvalidToken"):
+        monkeypatch.setattr(main, nombre, getattr(fernet, nombre), raising=False)
+    monkeypatch.setattr(main, "sesiones_selladas", _selladas(CLAVE_NUEVA, CLAVE_ANTERIOR))
+    return main.sesiones_selladas
+
+
+@pytest.fixture
+def cliente_sellado(modo_sellado):
+    return TestClient(main.SesionSelladaMiddleware(main.app), base_url="https://testserver")
+
+
+def test_sellar_y_abrir(modo_sellado):
+    sesion = _sesion()
+    token = modo_sellado.sellar(sesion)
+
+    assert "estudiante@" not in token
+    abierta, rotar = modo_sellado.abrir(token)
+    assert (abierta.id, abierta.email, abierta.cookies) == (sesion.id, sesion.email, sesion.cookies)
+    assert rotar is False
+
+
+def test_token_de_la_clave_anterior_se_abre_y_se_rota(modo_sellado):
+    token = _selladas(CLAVE_ANTERIOR).sellar(_sesion())
+
+    abierta, rotar = modo_sellado.abrir(token)
+    assert abierta.id == "sid-1"
+    assert rotar is True
+    # Sin la clave anterior ya no abre
+    assert _selladas(CLAVE_NUEVA).abrir(token) == (None, False)
+
+
+def test_login_emite_un_token_que_autentica(cliente_sellado):
+    token = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+
+    assert len(token) > 100  # el token, no un uuid
+    assert cliente_sellado.get("/api/verify-session").json() == {"success": True}
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 200
+
+
+def test_rotacion_reemite_la_cookie_con_la_clave_nueva(cliente_sellado, modo_sellado):
+    sesion, _ = modo_sellado.abrir(iniciar_sesion(cliente_sellado, STAFF_EMAIL))
+    cliente_sellado.cookies.set("session_id", _selladas(CLAVE_ANTERIOR).sellar(sesion))
+
+    respuesta = cliente_sellado.get("/api/respuestas/export")
+
+    assert respuesta.status_code == 200
+    nuevo = respuesta.cookies["session_id"]
+    assert _selladas(CLAVE_NUEVA).abrir(nuevo)[0].id == sesion.id
+
+
+def test_sesion_revocada_es_401(cliente_sellado):
+    token = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+    assert cliente_sellado.post("/api/logout").status_code == 200
+
+    # El token sigue siendo válido criptográficamente, pero quedó en la lista de revocadas
+    cliente_sellado.cookies.set("session_id", token)
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 401
+    assert cliente_sellado.get("/api/horario").status_code == 403
+
+
+def test_login_nuevo_no_revoca_el_anterior(cliente_sellado):
+    primero = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+    iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+
+    cliente_sellado.cookies.set("session_id", primero)
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 200
+
+
+def test_cookie_alterada_es_401(cliente_sellado, modo_sellado):
+    token = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+    # Un byte cambiado en el medio del token (dentro del texto cifrado o del HMAC)
+    medio = len(token) // 2
+    alterado = token[:medio] + ("A" if token[medio] != "A" else "B") + token[medio + 1:]
+    invalidas = modo_sellado.metricas["invalidas"]
+
+    cliente_sellado.cookies.set("session_id", alterado)
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 401
+    assert modo_sellado.metricas["invalidas"] == invalidas + 1
+
+
+def test_token_expirado_es_401(cliente_sellado, monkeypatch):
+    token = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+    monkeypatch.setattr(main, "SESSION_TIMEOUT_MINUTES", -1)
+
+    cliente_sellado.cookies.set("session_id", token)
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 401
+
+
+def test_el_id_crudo_no_autentica(cliente_sellado, modo_sellado):
+    token = iniciar_sesion(cliente_sellado, STAFF_EMAIL)
+    session_id = modo_sellado.abrir(token)[0].id
+
+    cliente_sellado.cookies.set("session_id", session_id)
+    assert cliente_sellado.get("/api/respuestas/export").status_code == 401
@@ -0,0 +1,30 @@
+import asyncio
+
+import main
+
+
+def test_detener_cierra_los_streams_y_cancela_el_sondeo(sesion, monkeypatch):
+    # Un sondeo que no termina solo: sólo la cancelación lo saca del sleep
+    monkeypatch.setattr(main, "PUBLICACIONES_POLL_SEGUNDOS", 3600)
+    session_id = sesion.cookies["session_id"]
+
+    async def correr():
+        poller = main.PollerPublicaciones(1)
+        cola = poller.suscribir(session_id)
+        tarea = poller.tarea
+        await asyncio.sleep(0.05)
+        assert not tarea.done()
+
+        await poller.detener()
+
+        assert tarea.cancelled()
+        assert poller.tarea is None
+        assert poller.suscriptores == {}
+        # El generador de /api/publicaciones/stream termina al recibir None
+        assert cola.get_nowait() is None
+
+    sesion.portal.call(correr)
+
+
+def test_detener_sin_suscriptores_no_falla(cliente):
+    cliente.portal.call(main.PollerPublicaciones(2).detener)
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+import main
+
+RUTA_ASISTENCIAS = "/estudiantes/get-asistencias"
+
+
+@pytest.fixture
+def asistencias_upstream(stub):
+    """Permite cambiar lo que devuelve el stub para get-asistencias durante un test."""
+    original = stub.JSONS[RUTA_ASISTENCIAS]
+
+    def cambiar(registros):
+        stub.JSONS[RUTA_ASISTENCIAS] = json.dumps(registros).encode()
+
+    yield json.loads(original), cambiar
+    stub.JSONS[RUTA_ASISTENCIAS] = original
+
+
+def _refetch(cliente):
+    # La siguiente lectura vuelve al upstream en vez de la cache de respuestas
+    main.respuesta_cache.invalidar(f"{cliente.cookies['session_id']}:asistencias")
+
+
+def test_since_vacio_devuelve_el_documento_completo(sesion, asistencias_upstream):
+    registros, _ = asistencias_upstream
+    cuerpo = sesion.get("/api/asistencias", params={"since": ""}).json()
+
+    assert cuerpo["modo"] == "completo"
+    assert cuerpo["datos"] == registros
+    assert cuerpo["version"]
+
+
+def test_since_desconocido_devuelve_el_documento_completo(sesion):
+    cuerpo = sesion.get("/api/asistencias", params={"since": "no-existe"}).json()
+    assert cuerpo["modo"] == "completo"
+
+
+def test_sin_cambios_el_delta_viene_vacio(sesion):
+    version = sesion.get("/api/asistencias", params={"since": ""}).json()["version"]
+    cuerpo = sesion.get("/api/asistencias", params={"since": version}).json()
+
+    assert cuerpo["modo"] == "delta"
+    assert cuerpo["base"] == cuerpo["version"] == version
+    assert cuerpo["colecciones"] == {}
+    assert cuerpo["campos"] == {}
+
+
+def test_delta_con_registros_agregados_modificados_y_eliminados(sesion, asistencias_upstream):
+    registros, cambiar = asistencias_upstream
+    base = sesion.get("/api/asistencias", params={"since": ""}).json()["version"]
+
+    modificado = dict(registros[0], estado="F" if registros[0]["estado"] != "F" else "A")
+    nuevo = {"id": 10_000, "curso": "Física", "fecha": "2025-07-01", "estado": "A"}
+    cambiar([modificado] + registros[2:] + [nuevo])
+    _refetch(sesion)
+
+    cuerpo = sesion.get("/api/asistencias", params={"since": base}).json()
+
+    assert cuerpo["modo"] == "delta"
+    assert cuerpo["base"] == base
+    assert cuerpo["version"] != base
+    assert cuerpo["colecciones"]["$"] == {
+        "agregados": [nuevo],
+        "modificados": [modificado],
+        "eliminados": [registros[1]["id"]],
+    }
+
+    # La versión nueva sirve de base para el siguiente delta
+    siguiente = sesion.get("/api/asistencias", params={"since": cuerpo["version"]}).json()
+    assert siguiente["modo"] == "delta"
+    assert siguiente["colecciones"] == {}
+
+
+def test_version_sin_cambios_no_se_vuelve_a_registrar(sesion, asistencias_upstream, monkeypatch):
+    registradas = []
+    registrar = main.snapshots_sync.registrar
+    monkeypatch.setattr(main.snapshots_sync, "registrar", lambda *a, **k: (registradas.append(a[1]), registrar(*a, **k)))
+    registros, cambiar = asistencias_upstream
+
+    version = sesion.get("/api/asistencias", params={"since": ""}).json()["version"]
+    sesion.get("/api/asistencias", params={"since": version})
+    sesion.get("/api/asistencias", params={"since": version})
+    assert registradas == [version]
+
+    cambiar(registros[1:])
+    _refetch(sesion)
+    nueva = sesion.get("/api/asistencias", params={"since": version}).json()["version"]
+    assert registradas == [version, nueva]
+
+
+def test_sin_since_la_respuesta_no_cambia_de_formato(sesion, asistencias_upstream):
+    registros, _ = asistencias_upstream
+    assert sesion.get("/api/asistencias").json() == registros
+
+
+def test_calcular_delta_sin_ids_reemplaza_la_coleccion():
+    anterior = {"items": [{"nombre": "a"}], "total": 1}
+    actual = {"items": [{"nombre": "a"}, {"nombre": "b"}], "total": 2, "extra": True}
+
+    delta = main.calcular_delta(anterior, actual)
+
+    assert delta["colecciones"] == {"items": {"reemplazo": actual["items"]}}
+    assert delta["campos"] == {"total": 2, "extra": True}
+    assert delta["campos_eliminados"] == []
+
+
+def test_calcular_delta_campos_eliminados():
+    delta = main.calcular_delta({"a": {"b": 1, "c": 2}}, {"a": {"b": 1}})
+    assert delta["campos_eliminados"] == ["a.c"]